@@ -394,124 +394,7 @@ class DokuWikiConverter:
         
         # Clean up the path
         path = path.split(':')[-1]  # Get last part of path
-        path = re.sub(r'\?.*
-
-    def _convert_plugins(self, content: str) -> str:
-        """Convert DokuWiki plugin syntax."""
-        # Remove indexmenu
-        content = re.sub(r'\{\{indexmenu>([^|}]+)(?:\|(?:[^}]+))?\}\}', '', content)
-        
-        # Convert include plugin
-        content = re.sub(r'\{\{(page|section)>([^|}]+)(?:\|(?:[^}]+))?\}\}', r'![\2]', content)
-        
-        return content
-
-    def _convert_code_block(self, block: str) -> str:
-        """Convert code blocks to markdown format."""
-        match = re.search(r'<code.*?>(.*?)</code>', block, re.DOTALL)
-        if match:
-            code = match.group(1).strip()
-            return f'\n```\n{code}\n```\n'
-        return block
-
-    def _convert_note_block(self, block: str) -> str:
-        """Convert note blocks to Obsidian callouts."""
-        match = re.search(r'<note(?:\s+(?P<type>tip|important|warning|caution))?\s*>(.*?)</note>', block, re.DOTALL)
-        if match:
-            note_type = match.group('type').upper() if match.group('type') else 'NOTE'
-            content = match.group(2).strip()
-            return f'\n> [!{note_type}]\n> {content}\n'
-        return block
-
-    def _convert_mermaid_block(self, block: str) -> str:
-        """Convert mermaid blocks to markdown format."""
-        match = re.search(r'<mermaid.*?>(.*?)</mermaid>', block, re.DOTALL)
-        if match:
-            content = match.group(1).strip()
-            return f'\n```mermaid\n{content}\n```\n'
-        return block
-
-    def _convert_uml_block(self, block: str) -> str:
-        """Convert UML blocks to markdown format."""
-        match = re.search(r'<uml.*?>(.*?)</uml>', block, re.DOTALL)
-        if match:
-            content = match.group(1).strip()
-            return f'\n```plantuml\n{content}\n```\n'
-        return block
-
-def get_valid_path(prompt: str, must_exist: bool = False) -> Path:
-    """
-    Prompt for and validate a directory path.
-    
-    Args:
-        prompt: The prompt to show to the user
-        must_exist: Whether the path must already exist
-    
-    Returns:
-        Path object of validated directory
-    """
-    while True:
-        path_str = input(prompt).strip()
-        
-        # Handle empty input
-        if not path_str:
-            print("Please enter a path.")
-            continue
-            
-        # Convert to Path object and resolve to absolute path
-        try:
-            path = Path(path_str).resolve()
-        except Exception as e:
-            print(f"Invalid path format: {e}")
-            continue
-            
-        # Check if path exists when required
-        if must_exist and not path.exists():
-            print(f"Path does not exist: {path}")
-            continue
-            
-        # For source folder, check if it has the required structure
-        if must_exist and 'pages' not in [x.name for x in path.iterdir()]:
-            print(f"Source folder must contain a 'pages' subdirectory: {path}")
-            continue
-            
-        return path
-
-def main():
-    """Main entry point for the converter."""
-    print("\nDokuWiki to Obsidian Markdown Converter")
-    print("---------------------------------------\n")
-    
-    try:
-        # Get source folder (must exist and have proper structure)
-        source = get_valid_path(
-            "Enter the path to DokuWiki's data folder (containing 'pages' subdirectory): ", 
-            must_exist=True
-        )
-        
-        # Get destination folder (will be created if doesn't exist)
-        dest = get_valid_path(
-            "Enter the destination path for Obsidian vault: "
-        )
-        
-        print(f"\nConverting from: {source}")
-        print(f"Converting to: {dest}\n")
-        
-        config = ConverterConfig(
-            source_folder=source,
-            destination_folder=dest
-        )
-        
-        converter = DokuWikiConverter(config)
-        converter.process_all_files()
-        
-        logging.info("Conversion completed successfully!")
-        
-    except Exception as e:
-        logging.error(f"Conversion failed: {str(e)}")
-        raise
-
-if __name__ == "__main__":main(), '', path)  # Remove query parameters
+        path = re.sub(r'\?.*$', '', path)  # Remove query parameters
         
         if is_image:
             return f"![[{path} | 300]]"  # Use consistent image size
@@ -545,8 +428,7 @@ if __name__ == "__main__":main(), '', path)  # Remove query parameters
 
     def _convert_formatting(self, content: str) -> str:
         """Convert DokuWiki text formatting to Markdown."""
-        # Bold
-        content = re.sub(r'\*\*(.+?)\*\*', r'**\1**', content)
+        # Bold needs no rule: DokuWiki ** is already Markdown **
         # Italic
         content = re.sub(r'//(.+?)//', r'*\1*', content)
         # Underline
@@ -558,16 +440,6 @@ if __name__ == "__main__":main(), '', path)  # Remove query parameters
         
         return content
 
-    def _convert_plugins(self, content: str) -> str:
-        """Convert DokuWiki plugin syntax."""
-        # Remove indexmenu
-        content = re.sub(r'\{\{indexmenu>([^|}]+)(?:\|(?:[^}]+))?\}\}', '', content)
-        
-        # Convert include plugin
-        content = re.sub(r'\{\{(page|section)>([^|}]+)(?:\|(?:[^}]+))?\}\}', r'![\2]', content)
-        
-        return content
-
     def _convert_code_block(self, block: str) -> str:
         """Convert code blocks to markdown format."""
         match = re.search(r'<code.*?>(.*?)</code>', block, re.DOTALL)
@@ -5,22 +5,40 @@ DokuWiki to Markdown Converter
 Entry point for the conversion process
 """
 
+import atexit
 import logging
+import multiprocessing
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from src.config import ConverterConfig
 from src.converter import DokuWikiConverter
 from src.utils.file_handling import FileHandler  # Updated import
 
 def setup_logging():
-    """Configure logging for the application."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('converter.log'),
-            logging.StreamHandler()
-        ]
-    )
+    """Configure logging for the application.
+
+    Log records are only enqueued on the calling thread; a QueueListener
+    drains them to the file and stream handlers on a dedicated thread, so
+    per-file log calls never block on handler locks or flushes. The queue
+    is a multiprocessing.Queue so records emitted inside pool workers
+    reach the listener too.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler('converter.log'),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = multiprocessing.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
 
 def main():
     """Main entry point for the converter."""
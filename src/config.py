@@ -11,7 +11,8 @@ class ConverterConfig:
     destination_folder: Path
     media_folder: str = 'media'
     default_image_width: int = 300
-    max_workers: int = 4
+    # None lets the converter size the pool from the machine's CPU count
+    max_workers: Optional[int] = None
     
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -1,9 +1,13 @@
 """Main converter class for DokuWiki to Markdown conversion."""
 
 import logging
+import multiprocessing
+import os
+import sys
 from pathlib import Path
-from typing import Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from logging.handlers import QueueHandler
 
 from .config import ConverterConfig
 from .converters.tables import TableConverter
@@ -14,6 +18,7 @@ from .converters.special import SpecialBlockConverter
 from .utils.file_handling import FileHandler  # Updated import
 from .utils.sanitization import sanitize_filename
 
+
 class DokuWikiConverter:
     """Main converter class for DokuWiki to Markdown conversion."""
     
@@ -29,11 +34,14 @@ class DokuWikiConverter:
         self.special_converter = SpecialBlockConverter()
         self.file_handler = FileHandler()  # Initialize FileHandler
 
-    def convert_file(self, dokuwiki_path: Path) -> Optional[Tuple[Path, str]]:
-        """Convert a single DokuWiki file to Markdown."""
+    def convert_file(self, dokuwiki_path: Path) -> Optional[Tuple[Path, bytes]]:
+        """Convert a single DokuWiki file to Markdown.
+
+        Returns the output path and the UTF-8 encoded markdown, so the
+        caller can compare and write bytes without re-encoding.
+        """
         try:
-            with dokuwiki_path.open('r', encoding='utf-8') as f:
-                content = f.read()
+            content = dokuwiki_path.read_bytes().decode('utf-8')
 
             # Extract title and convert content
             title = self._extract_first_heading(content)
@@ -46,7 +54,7 @@ class DokuWikiConverter:
             obsidian_path = obsidian_folder / f"{title}.md"
 
             self.logger.info(f"Converting {dokuwiki_path} to {obsidian_path}")
-            return obsidian_path, converted_content
+            return obsidian_path, converted_content.encode('utf-8')
 
         except Exception as e:
             self.logger.error(f"Error converting file {dokuwiki_path}: {str(e)}")
@@ -59,40 +67,149 @@ class DokuWikiConverter:
             if not pages_dir.exists():
                 raise ValueError(f"Pages directory not found: {pages_dir}")
                 
-            files = list(pages_dir.rglob('*.txt'))
+            files = list(FileHandler.iter_files(pages_dir, '.txt'))
             total_files = len(files)
-            
+
             if total_files == 0:
                 self.logger.warning(f"No .txt files found in {pages_dir}")
                 return
-                
+
             self.logger.info(f"Found {total_files} files to process")
             processed_count = 0
             error_count = 0
 
-            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-                futures = []
-                for file_path in files:
-                    futures.append(executor.submit(self.convert_file, file_path))
-
-                for future in futures:
-                    try:
-                        result = future.result()
-                        if result:
-                            obsidian_path, content = result
-                            if FileHandler.should_update_file(obsidian_path, content):  # Use class method
+            # Load the cache from the previous run so unchanged sources can
+            # skip conversion (and file reads) entirely.
+            cache_path = self.config.destination_folder / '.dokuwiki2md-cache.json'
+            cache = FileHandler.load_cache(cache_path)
+
+            to_convert = []
+            small_files = []
+            mtimes = {}
+            for file_path, file_stat in files:
+                # The stat result comes for free from enumeration: empty
+                # pages have nothing to convert, and tiny ones are cheaper
+                # to convert inline than to ship to a worker process.
+                if file_stat.st_size == 0:
+                    self.logger.info(f"Skipped empty source: {file_path}")
+                    continue
+                key = str(file_path)
+                mtimes[key] = file_stat.st_mtime_ns
+                entry = cache.get(key)
+                if (entry and entry.get('mtime_ns') == mtimes[key]
+                        and Path(entry.get('dest', '')).exists()):
+                    self.logger.info(f"Skipped unchanged source: {file_path}")
+                    continue
+                if file_stat.st_size < 256:
+                    small_files.append(file_path)
+                else:
+                    to_convert.append(file_path)
+
+            # Fall back to the CPU-derived default when no explicit pool
+            # size is configured.
+            max_workers = self.config.max_workers or min(32, (os.cpu_count() or 1) + 4)
+
+            # Sibling pages share a destination directory; remember which
+            # ones exist so each is only mkdir'd once per run.
+            created_dirs = set()
+
+            def handle_result(file_path: Path, result: Optional[Tuple[Path, bytes]]) -> None:
+                nonlocal processed_count, error_count
+                try:
+                    if result:
+                        obsidian_path, content = result
+                        if FileHandler.should_update_file(obsidian_path, content):  # Use class method
+                            if obsidian_path.parent not in created_dirs:
                                 obsidian_path.parent.mkdir(parents=True, exist_ok=True)
-                                obsidian_path.write_text(content, encoding='utf-8')
-                                processed_count += 1
-                                self.logger.info(f"Processed {processed_count}/{total_files}: {obsidian_path}")
+                                created_dirs.add(obsidian_path.parent)
+                            obsidian_path.write_bytes(content)
+                            processed_count += 1
+                            self.logger.info(f"Processed {processed_count}/{total_files}: {obsidian_path}")
+                        else:
+                            self.logger.info(f"Skipped unchanged file: {obsidian_path}")
+                        cache[str(file_path)] = {
+                            'mtime_ns': mtimes[str(file_path)],
+                            'dest': str(obsidian_path)
+                        }
+                except Exception as e:
+                    error_count += 1
+                    self.logger.error(f"Error processing file: {str(e)}")
+
+            # Tiny files are converted inline: the IPC round-trip would cost
+            # more than the conversion itself.
+            for file_path in small_files:
+                handle_result(file_path, self.convert_file(file_path))
+
+            if to_convert:
+                # Submit explicit batches of paths so each pool task carries
+                # one pickle round-trip for dozens of files instead of one
+                # per file.
+                batches = [
+                    to_convert[i:i + _BATCH_SIZE]
+                    for i in range(0, len(to_convert), _BATCH_SIZE)
+                ]
+                # Fork on Linux lets workers inherit the already compiled
+                # module-level patterns instead of re-importing and
+                # recompiling them on spawn. Scoped to Linux only: forking a
+                # process with running threads (the log listener) is unsafe
+                # on macOS, which is why CPython made spawn its default
+                # there. The initializer covers the spawn platforms.
+                mp_context = multiprocessing.get_context('fork') if sys.platform == 'linux' else None
+
+                # Hand the listener's multiprocessing queue to the workers:
+                # records logged in a child only reach the main process if
+                # they go through a queue that crosses the process boundary.
+                log_queue = next(
+                    (handler.queue for handler in logging.getLogger().handlers
+                     if isinstance(handler, QueueHandler)),
+                    None
+                )
+
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=mp_context,
+                    initializer=_init_worker,
+                    initargs=(self.config, log_queue)
+                ) as executor:
+                    # Keep a bounded window of batches in flight and drain
+                    # whichever finishes first, so writes overlap conversion
+                    # and results are not held for a slow early batch.
+                    window = 2 * max_workers
+                    in_flight = {
+                        executor.submit(_convert_batch, batch): batch
+                        for batch in batches[:window]
+                    }
+                    batch_iter = iter(batches[window:])
+                    while in_flight:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            batch = in_flight.pop(future)
+                            try:
+                                results = future.result()
+                            except Exception as e:
+                                # A failed batch (killed worker, unpicklable
+                                # result) must not abort the run: count its
+                                # files as errors and keep draining so the
+                                # cache and media copy still happen.
+                                error_count += len(batch)
+                                self.logger.error(f"Error processing batch: {str(e)}")
                             else:
-                                self.logger.info(f"Skipped unchanged file: {obsidian_path}")
-                    except Exception as e:
-                        error_count += 1
-                        self.logger.error(f"Error processing file: {str(e)}")
+                                for file_path, result in zip(batch, results):
+                                    handle_result(file_path, result)
+                            next_batch = next(batch_iter, None)
+                            if next_batch is None:
+                                continue
+                            try:
+                                in_flight[executor.submit(_convert_batch, next_batch)] = next_batch
+                            except Exception as e:
+                                error_count += len(next_batch)
+                                self.logger.error(f"Error submitting batch: {str(e)}")
+
+            FileHandler.save_cache(cache_path, cache)
 
             self.logger.info(f"\nConversion Summary:")
             self.logger.info(f"Total files found: {total_files}")
+            self.logger.info(f"Skipped unchanged or empty sources: {total_files - len(to_convert) - len(small_files)}")
             self.logger.info(f"Successfully processed: {processed_count}")
             self.logger.info(f"Errors encountered: {error_count}")
 
@@ -105,9 +222,15 @@ class DokuWikiConverter:
 
     def _extract_first_heading(self, content: str) -> str:
         """Extract and sanitize the first heading from DokuWiki content."""
-        import re
-        match = re.search(r'====== (.+?) ======', content)
-        title = match.group(1) if match else "Untitled"
+        # The delimiters are literal, so two str.find calls beat invoking
+        # the regex engine for this once-per-file lookup.
+        title = "Untitled"
+        start = content.find('====== ')
+        if start != -1:
+            start += 7
+            end = content.find(' ======', start)
+            if end != -1 and end > start:
+                title = content[start:end]
         return sanitize_filename(title)
 
     def _convert_content(self, content: str, root_path: Path) -> str:
@@ -124,4 +247,30 @@ class DokuWikiConverter:
         # Restore special blocks last
         content = self.special_converter.restore_blocks(content)
         
-        return content.strip()
\ No newline at end of file
+        return content.strip()
+
+# Worker-process state for process_all_files. Each worker builds its own
+# converter once (via the pool initializer) so per-batch tasks only need to
+# pickle the paths.
+_worker_converter: Optional[DokuWikiConverter] = None
+
+# Files per pool task; large enough to amortize submission overhead, small
+# enough to keep all workers busy on medium-sized wikis.
+_BATCH_SIZE = 64
+
+def _init_worker(config: ConverterConfig,
+                 log_queue: Optional['multiprocessing.queues.Queue'] = None) -> None:
+    """Initialize the per-process converter used by _convert_batch."""
+    if log_queue is not None:
+        # Point the worker's root logger at the main process's listener
+        # queue (fork inherits the handler, so guard against doubling up).
+        root = logging.getLogger()
+        if not any(isinstance(handler, QueueHandler) for handler in root.handlers):
+            root.addHandler(QueueHandler(log_queue))
+            root.setLevel(logging.INFO)
+    global _worker_converter
+    _worker_converter = DokuWikiConverter(config)
+
+def _convert_batch(paths: List[Path]) -> List[Optional[Tuple[Path, bytes]]]:
+    """Convert a batch of files in a worker process."""
+    return [_worker_converter.convert_file(path) for path in paths]
@@ -3,40 +3,60 @@
 import re
 from typing import Dict, List, Tuple
 
+# Compiled once at import time so repeated convert() calls skip the pattern
+# cache lookup that re.sub with string patterns pays on every invocation.
+
+# All six heading levels in one alternation; the backreference guarantees the
+# closing marker matches the opening one, so a single pass replaces the six
+# per-level scans.
+_HEADING_RE = re.compile(r'^(={1,6}) (.+?) \1', re.MULTILINE)
+
+def _heading_repl(match: re.Match) -> str:
+    return '#' * (7 - len(match.group(1))) + ' ' + match.group(2)
+
+# Inline styling in one alternation: italic, underline and strikethrough
+# each capture into their own group, and the callback dispatches on which
+# one matched. (Bold needs no rule: DokuWiki ** is already Markdown **.)
+_INLINE_RE = re.compile(r'//(.+?)//|__(.+?)__|<del>(.*?)</del>')
+
+def _inline_repl(match: re.Match) -> str:
+    italic, underline, strike = match.group(1, 2, 3)
+    # Recurse into the matched span so nested markup (__//x//__) converts
+    # the way the old sequential passes did; spans strictly shrink, so the
+    # recursion terminates.
+    if italic is not None:
+        return f'*{_INLINE_RE.sub(_inline_repl, italic)}*'
+    if underline is not None:
+        return f'<u>{_INLINE_RE.sub(_inline_repl, underline)}</u>'
+    return f'~~{_INLINE_RE.sub(_inline_repl, strike)}~~'
+
+# Lists in one pass: the captured indent width picks the nesting level
+# (0-3 spaces -> 0, 4-6 -> 1, 7-9 -> 2, 10-12 -> 3), replacing the four
+# per-level scans.
+_LIST_RE = re.compile(r'^( {0,12})([*-]) ', re.MULTILINE)
+
+def _list_repl(match: re.Match) -> str:
+    level = max(0, (len(match.group(1)) - 1) // 3)
+    return '    ' * level + match.group(2) + ' '
+
+_CONVERSIONS: List[Tuple[re.Pattern, str]] = [
+    # Remove line breaks
+    (re.compile(r'\\\\', re.MULTILINE), ''),
+
+    # Clean up multiple blank lines
+    (re.compile(r'\n\s*\n+', re.MULTILINE), '\n\n')
+]
+
 class FormattingConverter:
     """Converts DokuWiki text formatting to Markdown."""
 
     def convert(self, content: str) -> str:
         """Convert DokuWiki formatting to Markdown."""
-        conversions = [
-            # Headings (in reverse order to prevent wrong replacements)
-            (r'^====== (.+?) ======', r'# \1'),
-            (r'^===== (.+?) =====', r'## \1'),
-            (r'^==== (.+?) ====', r'### \1'),
-            (r'^=== (.+?) ===', r'#### \1'),
-            (r'^== (.+?) ==', r'##### \1'),
-            (r'^= (.+?) =', r'###### \1'),
-            
-            # Text styling
-            (r'\*\*(.+?)\*\*', r'**\1**'),  # Bold
-            (r'//(.+?)//', r'*\1*'),         # Italic
-            (r'__(.+?)__', r'<u>\1</u>'),    # Underline
-            (r'<del>(.*?)</del>', r'~~\1~~'), # Strikethrough
-            
-            # Lists (preserve indentation)
-            (r'^ {0,3}([*-]) ', r'\1 '),
-            (r'^ {4,6}([*-]) ', r'    \1 '),
-            (r'^ {7,9}([*-]) ', r'        \1 '),
-            (r'^ {10,12}([*-]) ', r'            \1 '),
-            
-            # Remove line breaks
-            (r'\\\\', ''),
-            
-            # Clean up multiple blank lines
-            (r'\n\s*\n+', '\n\n')
-        ]
-        
-        for pattern, replacement in conversions:
-            content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
-            
-        return content.strip()
\ No newline at end of file
+        content = _HEADING_RE.sub(_heading_repl, content)
+        content = _INLINE_RE.sub(_inline_repl, content)
+        content = _LIST_RE.sub(_list_repl, content)
+
+        for pattern, replacement in _CONVERSIONS:
+            content = pattern.sub(replacement, content)
+
+        return content.strip()
@@ -2,69 +2,86 @@
 
 import re
 from pathlib import Path
-from typing import Optional
+
+# Compiled once at import time and shared by all converter instances. One
+# alternation matches both media embeds and internal/external links, so a
+# document is scanned once instead of once per syntax kind.
+# Piped and plain links get their own branches so the handlers never test
+# for a missing text group at runtime.
+_MEDIA_LINK_RE = re.compile(
+    r'\{\{([^|}]+)(?:\|(?:[^}]+))?\}\}'   # media embed: path in group 1
+    r'|\[\[([^|\]]+)\|([^]]+)\]\]'        # piped link: target 2, text 3
+    r'|\[\[([^|\]]+)\]\]'                 # plain link: target in group 4
+)
+_URL_RE = re.compile(r'https?://')
+
+# Tuple form so the check is a single endswith call.
+_IMAGE_EXTS = ('.jpg', '.jpeg', '.png', '.svg', '.gif')
 
 class MediaConverter:
     """Converts DokuWiki media and links to Markdown format."""
-    
+
     def __init__(self, default_image_width: int = 300):
         self.default_image_width = default_image_width
-        self.image_extensions = {'jpg', 'jpeg', 'png', 'svg', 'gif'}
 
     def convert(self, content: str, root_path: Path) -> str:
         """Convert DokuWiki media and links to Markdown format."""
-        # Convert media/image links
-        content = re.sub(
-            r'\{\{([^|}]+)(?:\|(?:[^}]+))?\}\}',
-            self._convert_media_link,
-            content
-        )
-        
-        # Convert internal links
-        content = re.sub(
-            r'\[\[([^|]+)(?:\|([^]]+))?\]\]',
-            lambda m: self._convert_link(m, root_path),
-            content
-        )
-        
-        return content
-
-    def _convert_media_link(self, match) -> str:
+        # Plain-text pages are common; two C-level substring checks beat
+        # a full regex scan that cannot match anything.
+        if '{{' not in content and '[[' not in content:
+            return content
+        return _MEDIA_LINK_RE.sub(self._convert_match, content)
+
+    def _convert_match(self, match: re.Match) -> str:
+        """Dispatch a fused match to the media or link handler."""
+        if match.group(1) is not None:
+            return self._convert_media_link(match.group(1))
+        if match.group(2) is not None:
+            return self._convert_piped_link(match.group(2), match.group(3))
+        return self._convert_plain_link(match.group(4))
+
+    def _convert_media_link(self, path: str) -> str:
         """Convert a DokuWiki media link to Markdown format."""
-        path = match.group(1)
-        caption = match.group(2) if len(match.groups()) > 1 else None
-        
         # Clean up the path
-        clean_path = path.split(':')[-1]  # Get last part of path
+        clean_path = path.rsplit(':', 1)[-1]  # Get last part of path
         clean_path = clean_path.split('?')[0]  # Remove query parameters
-        
-        extension = clean_path.split('.')[-1].lower() if '.' in clean_path else ''
-        is_image = extension in self.image_extensions
-        
+
+        is_image = clean_path.lower().endswith(_IMAGE_EXTS)
+
         if is_image:
             return f"![[{clean_path} | {self.default_image_width}]]"
         return f"![[{clean_path}]]"
 
-    def _convert_link(self, match, root_path: Path) -> str:
-        """Convert a DokuWiki link to Markdown format."""
-        link = match.group(1)
-        text = match.group(2) if len(match.groups()) > 1 else None
-        
+    def _convert_piped_link(self, link: str, text: str) -> str:
+        """Convert a DokuWiki link with display text to Markdown format."""
         # Handle external links
-        if any(prefix in link for prefix in ['http://', 'https://']):
-            return f"[{text or link}]({link})"
-        
-        # Handle internal links
-        parts = link.split(':')
-        filename = parts[-1]
-        
+        if _URL_RE.match(link):
+            return f"[{text}]({link})"
+
+        # Handle internal links (only the last namespace part matters)
+        filename = link.rsplit(':', 1)[-1]
+
         # Handle heading anchors
         if '#' in filename:
             filename, heading = filename.split('#', 1)
-            if text:
-                return f"[[{filename}#{heading}|{text}]]"
-            return f"[[{filename}#{heading}]]"
-        
-        if text and text.lower() != filename.lower():
+            return f"[[{filename}#{heading}|{text}]]"
+
+        if text.lower() != filename.lower():
             return f"[[{filename}|{text}]]"
-        return f"[[{filename}]]"
\ No newline at end of file
+        return f"[[{filename}]]"
+
+    def _convert_plain_link(self, link: str) -> str:
+        """Convert a DokuWiki link without display text to Markdown format."""
+        # Handle external links
+        if _URL_RE.match(link):
+            return f"[{link}]({link})"
+
+        # Handle internal links (only the last namespace part matters)
+        filename = link.rsplit(':', 1)[-1]
+
+        # Handle heading anchors
+        if '#' in filename:
+            filename, heading = filename.split('#', 1)
+            return f"[[{filename}#{heading}]]"
+
+        return f"[[{filename}]]"
@@ -25,6 +25,28 @@ Fallback handling for unsupported plugins """
 import re
 from typing import Optional, List
 
+# Compiled once at import time; each file conversion reuses them.
+# The {{...}}-family plugins and radar blocks are mutually exclusive, so one
+# alternation replaces the five separate full-document passes; the callback
+# dispatches on which named group matched.
+_PLUGIN_RE = re.compile(
+    r'\{\{tag>(?P<tags>.*?)\}\}'
+    r'|(?s:<radar.*?>(?P<radar>.*?)</radar>)'
+    r'|\{\{drawio>(?P<drawio>.*?)\}\}'
+    r'|\{\{indexmenu>(?P<indexmenu>[^|}]+)(?:\|(?:[^}]+))?\}\}'
+    r'|\{\{(?:page|section)>(?P<include>[^|}]+)(?:\|(?:[^}]+))?\}\}'
+)
+_TAG_SPLIT_RE = re.compile(r'"([^"]+)"|(\S+)')
+# [\s\S]*? spans newlines with a single character class, where the old
+# (.|\n)*? alternation forced the engine to branch (and save a group) at
+# every character — the classic backtracking blowup shape on unclosed tags.
+_WRAP_NOPRINT_RE = re.compile(r'<WRAP[ \t]*noprint(.*?)>([\s\S]*?)</WRAP>')
+_WRAP_RE = re.compile(r'<(WRAP|wrap|div|block)[ \t]*(.*?)>([\s\S]*?)</(WRAP|wrap|div|block)>')
+_WRAP_OPEN_RE = re.compile(r'<(WRAP|wrap)[ \t]*(.*?)>')
+_WRAP_CLOSE_RE = re.compile(r'</(WRAP|wrap)[ \t]*(.*?)>')
+_FONT_RE = re.compile(r'<font.*?>([\s\S]*?)</font>')
+_UNKNOWN_PLUGIN_RE = re.compile(r'\{\{(?!tag>|drawio>|page>|section>)[^}]+\}\}')
+
 class PluginConverter:
     """Converts DokuWiki plugin syntax to Markdown."""
 
@@ -38,74 +60,54 @@ class PluginConverter:
         Returns:
             The converted Markdown content
         """
-        # Process plugins in specific order to avoid conflicts
-        conversions = [
-            self._convert_tags,
-            self._convert_radar_charts,
-            self._convert_drawio,
-            self._convert_indexmenu,
-            self._convert_include,
-            self._convert_wrap_plugin,
-            self._convert_ckgedit
-        ]
-        
-        for conversion in conversions:
-            content = conversion(content)
-        
+        # All plugin syntax opens with {{ or a tag; skip every pass when
+        # neither byte sequence occurs
+        if '{{' not in content and '<' not in content:
+            return content
+
+        # One fused pass for the mutually exclusive plugin syntaxes, then
+        # the wrap stages (which need their own fallback cleanup passes)
+        # and CKEditor syntax.
+        content = _PLUGIN_RE.sub(self._convert_plugin_match, content)
+        content = self._convert_wrap_plugin(content)
+        content = self._convert_ckgedit(content)
+
         return content
 
-    def _convert_tags(self, content: str) -> str:
-        """Convert DokuWiki tag syntax to Markdown tags."""
-        def process_tag_match(match):
-            # Extract tags from the tag syntax
-            tags_text = match.group(1)
-            # Use regex to split by spaces or handle quoted tags
-            tags = re.findall(r'"([^"]+)"|(\S+)', tags_text)
-            # Flatten the tuples and remove empty strings
-            tags = [tag for group in tags for tag in group if tag]
-            # Format as Markdown tags
-            return ' '.join(f"#{tag.replace(' ', '_').replace('-', '_')}" for tag in tags)
-
-        # Replace all tag syntax in the content
-        return re.sub(r'\{\{tag>(.*?)\}\}', process_tag_match, content)
-
-
-    def _convert_radar_charts(self, content: str) -> str:
-        """Convert radar charts to a comment block since Obsidian doesn't support them directly."""
-        return re.sub(
-            r'<radar.*?>(.*?)</radar>',
-            r'```comment\nRadar chart not supported in Obsidian:\n\1\n```',
-            content,
-            flags=re.DOTALL
-        )
-
-    def _convert_drawio(self, content: str) -> str:
-        """Convert drawio diagrams to standard image links."""
-        def process_drawio(match):
-            path = match.group(1)
-            filename = path.split(':')[-1]
+    def _convert_plugin_match(self, match: re.Match) -> str:
+        """Dispatch a fused plugin match to the right conversion."""
+        kind = match.lastgroup
+        if kind == 'tags':
+            return self._convert_tags(match.group('tags'))
+        if kind == 'radar':
+            # Radar charts become comment blocks since Obsidian doesn't
+            # support them directly
+            return (f"```comment\nRadar chart not supported in Obsidian:\n"
+                    f"{match.group('radar')}\n```")
+        if kind == 'drawio':
+            # drawio diagrams become standard image links
+            filename = match.group('drawio').rsplit(':', 1)[-1]
             return f"![[{filename} | 300]]"
-            
-        return re.sub(r'\{\{drawio>(.*?)\}\}', process_drawio, content)
-
-    def _convert_indexmenu(self, content: str) -> str:
-        """Remove indexmenu plugin syntax as it's not needed in Obsidian."""
-        return re.sub(r'\{\{indexmenu>([^|}]+)(?:\|(?:[^}]+))?\}\}', '', content)
-
-    def _convert_include(self, content: str) -> str:
-        """Convert include plugin to Obsidian embeds."""
-        def process_include(match):
-            type_of_include = match.group(1)  # page or section
-            path = match.group(2)
-            filename = path.split(':')[-1]
-            return f"![[{filename}]]"
-            
-        return re.sub(r'\{\{(page|section)>([^|}]+)(?:\|(?:[^}]+))?\}\}', process_include, content)
+        if kind == 'indexmenu':
+            # indexmenu isn't needed in Obsidian
+            return ''
+        # include plugin becomes an Obsidian embed
+        filename = match.group('include').rsplit(':', 1)[-1]
+        return f"![[{filename}]]"
+
+    def _convert_tags(self, tags_text: str) -> str:
+        """Convert the body of a DokuWiki tag syntax to Markdown tags."""
+        # Use regex to split by spaces or handle quoted tags
+        tags = _TAG_SPLIT_RE.findall(tags_text)
+        # Flatten the tuples and remove empty strings
+        tags = [tag for group in tags for tag in group if tag]
+        # Format as Markdown tags
+        return ' '.join(f"#{tag.replace(' ', '_').replace('-', '_')}" for tag in tags)
 
     def _convert_wrap_plugin(self, content: str) -> str:
         """Convert WRAP plugin syntax to appropriate Markdown/HTML."""
         # Remove noprint wraps
-        content = re.sub(r'<WRAP[ \t]*noprint(.*?)>((.|\n)*?)</WRAP>', r'\2', content)
+        content = _WRAP_NOPRINT_RE.sub(r'\2', content)
         
         # Convert other wraps to callouts when appropriate
         def process_wrap(match):
@@ -114,28 +116,19 @@ class PluginConverter:
                 return ''
             return f"\n> [!tip | cc-nt]\n> {wrap_content}\n"
             
-        content = re.sub(r'<(WRAP|wrap|div|block)[ \t]*(.*?)>((.|\n)*?)</(WRAP|wrap|div|block)>', 
-                        process_wrap, content)
+        content = _WRAP_RE.sub(process_wrap, content)
         
         # Clean up any remaining wrap tags
-        content = re.sub(r'<(WRAP|wrap)[ \t]*(.*?)>', '', content)
-        content = re.sub(r'</(WRAP|wrap)[ \t]*(.*?)>', '', content)
+        content = _WRAP_OPEN_RE.sub('', content)
+        content = _WRAP_CLOSE_RE.sub('', content)
         
         return content
 
     def _convert_ckgedit(self, content: str) -> str:
         """Convert CKEditor-specific syntax to Markdown/HTML."""
         # Convert font tags to emphasis
-        return re.sub(r'<font.*?>((.|\n)*?)</font>', r'==\1==', content)
+        return _FONT_RE.sub(r'==\1==', content)
 
     def _remove_unsupported_plugins(self, content: str) -> str:
         """Remove any unsupported plugin syntax to keep the output clean."""
-        # Add patterns for any other plugins that should be removed
-        patterns = [
-            r'\{\{(?!tag>|drawio>|page>|section>)[^}]+\}\}',  # Remove unknown plugin syntax
-        ]
-        
-        for pattern in patterns:
-            content = re.sub(pattern, '', content)
-            
-        return content
\ No newline at end of file
+        return _UNKNOWN_PLUGIN_RE.sub('', content)
\ No newline at end of file
@@ -1,110 +1,91 @@
 """Special block conversion for DokuWiki to Markdown."""
 
 import re
-import uuid
-from typing import Dict, Optional
+from typing import List, Tuple
+
+# Compiled once at import time. A single alternation matches every special
+# block kind in one pass; the backreference ensures the closing tag matches
+# the opening one.
+_BLOCK_RE = re.compile(r'<(code|note|mermaid|uml)(\s[^>]*)?>(.*?)</\1>', re.DOTALL)
+# Placeholders are short sequential tokens delimited by NUL bytes, which
+# cannot appear in DokuWiki page content.
+_PLACEHOLDER_RE = re.compile(r'\x00B(\d+)\x00')
+
+_NOTE_TYPES = frozenset({'tip', 'important', 'warning', 'caution'})
 
 class SpecialBlockConverter:
     """Handles conversion of special blocks like code, notes, mermaid, and UML."""
 
     def __init__(self):
-        self._preserved_blocks: Dict[str, str] = {}
+        # Each entry is (kind, attrs, body) as captured by _BLOCK_RE, so
+        # restoring never needs to re-parse the block text.
+        self._preserved_blocks: List[Tuple[str, str, str]] = []
 
     def preserve_blocks(self, content: str) -> str:
         """
-        Preserve special blocks by replacing them with unique identifiers.
-        
+        Preserve special blocks by replacing them with placeholder tokens.
+
         Args:
             content: The content to process
-            
+
         Returns:
             Content with special blocks replaced by placeholders
         """
         self._preserved_blocks.clear()
-        
-        # Define patterns for special blocks
-        patterns = {
-            'code': r'(<code.*?>.*?</code>)',
-            'note': r'(<note.*?>.*?</note>)',
-            'mermaid': r'(<mermaid.*?>.*?</mermaid>)',
-            'uml': r'(<uml.*?>.*?</uml>)'
-        }
-        
-        for block_type, pattern in patterns.items():
-            content = self._preserve_pattern(content, pattern)
-            
-        return content
+
+        # Every preservable block opens with a tag; skip the scan when the
+        # page has no '<' at all
+        if '<' not in content:
+            return content
+
+        def preserve(match: re.Match) -> str:
+            self._preserved_blocks.append(
+                (match.group(1), match.group(2) or '', match.group(3))
+            )
+            return f'\x00B{len(self._preserved_blocks) - 1}\x00'
+
+        return _BLOCK_RE.sub(preserve, content)
 
     def restore_blocks(self, content: str) -> str:
         """
         Restore preserved blocks with their converted markdown equivalents.
-        
+
         Args:
             content: Content with preserved block placeholders
-            
+
         Returns:
             Content with special blocks converted to markdown
         """
-        for uid, block in self._preserved_blocks.items():
-            if '<code' in block:
-                converted = self._convert_code_block(block)
-            elif '<note' in block:
-                converted = self._convert_note_block(block)
-            elif '<mermaid' in block:
-                converted = self._convert_mermaid_block(block)
-            elif '<uml' in block:
-                converted = self._convert_uml_block(block)
-            else:
-                converted = block
-            content = content.replace(uid, converted)
-            
-        return content
-
-    def _preserve_pattern(self, content: str, pattern: str) -> str:
-        """Replace pattern matches with unique identifiers."""
-        matches = re.finditer(pattern, content, re.DOTALL)
-        for match in matches:
-            uid = str(uuid.uuid4())
-            self._preserved_blocks[uid] = match.group(0)
-            content = content.replace(match.group(0), uid)
-        return content
-
-    def _convert_code_block(self, block: str) -> str:
+        def restore(match: re.Match) -> str:
+            kind, attrs, body = self._preserved_blocks[int(match.group(1))]
+            if kind == 'code':
+                return self._convert_code_block(attrs, body)
+            elif kind == 'note':
+                return self._convert_note_block(attrs, body)
+            elif kind == 'mermaid':
+                return self._convert_mermaid_block(body)
+            return self._convert_uml_block(body)
+
+        return _PLACEHOLDER_RE.sub(restore, content)
+
+    def _convert_code_block(self, attrs: str, body: str) -> str:
         """Convert code blocks to markdown format."""
-        match = re.search(r'<code(?:\s+(\w+))?\s*>(.*?)</code>', block, re.DOTALL)
-        if match:
-            language = match.group(1) or ''
-            code = match.group(2).strip()
-            return f'\n```{language}\n{code}\n```\n'
-        return block
-
-    def _convert_note_block(self, block: str) -> str:
+        language = attrs.split()[0] if attrs.strip() else ''
+        return f'\n```{language}\n{body.strip()}\n```\n'
+
+    def _convert_note_block(self, attrs: str, body: str) -> str:
         """Convert note blocks to Obsidian callouts."""
-        match = re.search(
-            r'<note(?:\s+(?P<type>tip|important|warning|caution))?\s*>(?P<content>.*?)</note>',
-            block,
-            re.DOTALL
-        )
-        if match:
-            note_type = match.group('type').upper() if match.group('type') else 'NOTE'
-            content = match.group('content').strip()
-            # Format content for callout - indent all lines
-            content = '\n> '.join(content.split('\n'))
-            return f'\n> [!{note_type}]\n> {content}\n'
-        return block
-
-    def _convert_mermaid_block(self, block: str) -> str:
+        note_type = attrs.strip().lower()
+        note_type = note_type.upper() if note_type in _NOTE_TYPES else 'NOTE'
+        # Format content for callout - indent all lines (single C-level
+        # pass, no intermediate list)
+        content = body.strip().replace('\n', '\n> ')
+        return f'\n> [!{note_type}]\n> {content}\n'
+
+    def _convert_mermaid_block(self, body: str) -> str:
         """Convert mermaid blocks to markdown format."""
-        match = re.search(r'<mermaid.*?>(.*?)</mermaid>', block, re.DOTALL)
-        if match:
-            content = match.group(1).strip()
-            return f'\n```mermaid\n{content}\n```\n'
-        return block
+        return f'\n```mermaid\n{body.strip()}\n```\n'
 
-    def _convert_uml_block(self, block: str) -> str:
+    def _convert_uml_block(self, body: str) -> str:
         """Convert UML blocks to plantuml format."""
-        match = re.search(r'<uml.*?>(.*?)</uml>', block, re.DOTALL)
-        if match:
-            content = match.group(1).strip()
-            return f'\n```plantuml\n{content}\n```\n'
-        return block
\ No newline at end of file
+        return f'\n```plantuml\n{body.strip()}\n```\n'
@@ -1,60 +1,82 @@
 """Table conversion module for DokuWiki to Markdown."""
 
 import re
-from typing import List
+from typing import Dict
+
+# Compiled once at import time.
+# A table block is a run of consecutive lines starting with | or ^; matching
+# whole blocks lets one substitution handle each table instead of the Python
+# loop visiting every line of the document.
+_TABLE_BLOCK_RE = re.compile(r'(?:^[ \t]*[|^][^\n]*\n?)+', re.MULTILINE)
+# Normalizing ^ to | lets the C-level str.split cut a row into cells,
+# which is markedly faster than regex extraction on a two-char class.
+_SEP_TABLE = str.maketrans('^', '|')
+_CODE_IN_CELL_RE = re.compile(r'<code.*?>(.*?)</code>')
+
+# Separator rows depend only on the column count, and most tables in a wiki
+# share a handful of widths; cache them so repeated shapes are a dict hit.
+_SEPARATOR_CACHE: Dict[int, str] = {}
 
 class TableConverter:
     """Converts DokuWiki tables to Markdown format."""
 
     def convert(self, content: str) -> str:
-        """ Replace escaped pipes before splitting"""
-        content = content.replace('/%%\|%%/g', '\\u0001')
-
         """Convert DokuWiki tables to Markdown tables."""
-        lines = content.split('\n')
+        # No row delimiter bytes at all means no tables to find
+        if '|' not in content and '^' not in content:
+            return content
+
+        # One substitution per table block; non-table text is never visited
+        # by the Python-level row loop.
+        return _TABLE_BLOCK_RE.sub(self._convert_table_block, content)
+
+    def _convert_table_block(self, match: re.Match) -> str:
+        """Convert one block of consecutive table lines to a Markdown table."""
+        block = match.group(0)
+        lines = block.splitlines()
         markdown_lines = []
-        in_table = False
-        header_row = False
-        
+        header_row = lines[0].strip().startswith('^')
 
         for line in lines:
-            if line.strip().startswith('^') or line.strip().startswith('|'):
-                if not in_table:
-                    in_table = True
-                    header_row = line.strip().startswith('^')
-
-                # Split cells and process content
-                cells = re.split(r'[\^|]', line.strip('|^'))
-                cells = [self._process_cell_content(cell) for cell in cells if cell.strip()]
-                
-                # Create table row
-                row = f"| {' | '.join(cells)} |"
-                markdown_lines.append(row)
-                
-                # Add separator row after headers
-                if header_row:
-                    markdown_lines.append(f"|{'|'.join(['---' for _ in cells])}|")
-                    header_row = False
-            else:
-                if in_table:
-                    markdown_lines.append('')  # Add empty line after table
-                    in_table = False
-                markdown_lines.append(line)
-        
-        return '\n'.join(markdown_lines)
+            # Extract cells and process content
+            cells = [self._process_cell_content(cell)
+                     for cell in line.strip('|^').translate(_SEP_TABLE).split('|')
+                     if cell.strip()]
+
+            # Create table row
+            row = f"| {' | '.join(cells)} |"
+            markdown_lines.append(row)
+
+            # Add separator row after headers
+            if header_row:
+                separator = _SEPARATOR_CACHE.get(len(cells))
+                if separator is None:
+                    separator = '|' + '|'.join(['-' * 10] * len(cells)) + '|'
+                    _SEPARATOR_CACHE[len(cells)] = separator
+                markdown_lines.append(separator)
+                header_row = False
+
+        table = '\n'.join(markdown_lines)
+        if block.endswith('\n'):
+            # Keep a blank line between the table and any following content
+            return table + ('\n\n' if match.end() < len(match.string) else '\n')
+        return table
 
     def _process_cell_content(self, cell: str) -> str:
         """Process the content of a table cell."""
         # Handle linebreaks in cells by replacing them with <br>
         cell = cell.replace('\n', '<br>')
-        
-        # Handle code blocks in cells
-        cell = re.sub(r'<code.*?>(.*?)</code>', r'```\1```', cell)
-        
-        # Restore escaped pipes
-        cell = cell.replace('\\u0001', '\|')
-        
+
+        # Handle code blocks in cells: inline code in a Markdown table cell
+        # uses single backticks. When every opening tag is the bare literal
+        # <code>, str.replace covers the cell at memcpy speed; a cell with
+        # an attributed tag (<code bash>) goes to the compiled pattern,
+        # which handles bare and attributed tags alike.
+        if '<code' in cell:
+            if cell.count('<code') == cell.count('<code>'):
+                cell = cell.replace('<code>', '`').replace('</code>', '`')
+            else:
+                cell = _CODE_IN_CELL_RE.sub(r'`\1`', cell)
+
         # Clean up whitespace while preserving intentional spacing
-        cell = re.sub(r'^\s+|\s+$', '', cell)
-        
-        return cell
\ No newline at end of file
+        return cell.strip()
\ No newline at end of file
@@ -7,7 +7,7 @@ Better encapsulation of file handling operations
 
 Additional Methods:
 
-should_update_file: Checks if content has changed using MD5 hashing
+should_update_file: Checks if content has changed via size and byte comparison
 copy_media_files: Handles media file transfers with directory structure preservation
 ensure_directory: Creates directories as needed
 clean_directory: Utility for cleaning directories
@@ -20,11 +20,12 @@ Preservation of file timestamps
 Directory structure maintenance
 """
 
+import json
 import os
 import shutil
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple
 
 class FileHandler:
     """Handles file operations for the converter."""
@@ -62,21 +63,49 @@ class FileHandler:
                 continue
                 
             # For source folder, check if it has the required structure
-            if must_exist and 'pages' not in [x.name for x in path.iterdir()]:
+            # (single stat instead of enumerating the whole directory)
+            if must_exist and not (path / 'pages').is_dir():
                 print(f"Source folder must contain a 'pages' subdirectory: {path}")
                 continue
                 
             return path
 
     @staticmethod
-    def should_update_file(file_path: Path, new_content: str) -> bool:
+    def iter_files(root: Path, suffix: Optional[str] = None) -> Iterator[Tuple[Path, os.stat_result]]:
         """
-        Check if a file should be updated based on content hash.
-        
+        Yield all files under a directory tree recursively.
+
+        Uses os.scandir directly, which reuses the file type from the
+        directory entries instead of stat-ing and fnmatch-ing every entry
+        the way Path.rglob does. The stat result is yielded alongside the
+        path (cached on the directory entry) so callers can check sizes
+        and mtimes without stat-ing again.
+
+        Args:
+            root: Directory to walk
+            suffix: Optional filename suffix filter (e.g. '.txt')
+
+        Yields:
+            (path, stat result) pairs for the matching files
+        """
+        stack = [str(root)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file() and (suffix is None or entry.name.endswith(suffix)):
+                        yield Path(entry.path), entry.stat()
+
+    @staticmethod
+    def should_update_file(file_path: Path, new_content: bytes) -> bool:
+        """
+        Check if a file should be updated based on its content.
+
         Args:
             file_path: Path to the existing file
-            new_content: New content to compare against
-            
+            new_content: New UTF-8 encoded content to compare against
+
         Returns:
             True if file should be updated, False otherwise
         """
@@ -84,19 +113,59 @@ class FileHandler:
             return True
 
         try:
-            # Calculate MD5 hash of existing content
-            with file_path.open('r', encoding='utf-8') as f:
-                existing_hash = hashlib.md5(f.read().encode()).hexdigest()
-            
-            # Calculate MD5 hash of new content
-            new_hash = hashlib.md5(new_content.encode()).hexdigest()
-            
-            # Return True if content has changed
-            return existing_hash != new_hash
+            # Cheap size-based short-circuit before reading anything
+            if file_path.stat().st_size != len(new_content):
+                return True
+
+            # Sizes match, so compare raw bytes in 64 KiB chunks: peak
+            # memory stays bounded for large pages and the first differing
+            # chunk ends the read early.
+            view = memoryview(new_content)
+            offset = 0
+            with file_path.open('rb') as f:
+                while chunk := f.read(65536):
+                    if view[offset:offset + len(chunk)] != chunk:
+                        return True
+                    offset += len(chunk)
+            return False
         except Exception:
             # If there's any error reading the file, assume it needs updating
             return True
 
+    @staticmethod
+    def load_cache(cache_path: Path) -> Dict[str, dict]:
+        """
+        Load the conversion cache from a previous run.
+
+        Args:
+            cache_path: Path to the cache file
+
+        Returns:
+            Mapping of source path to its cached mtime and destination,
+            or an empty dict if no usable cache exists
+        """
+        try:
+            with cache_path.open('r', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def save_cache(cache_path: Path, cache: Dict[str, dict]) -> None:
+        """
+        Persist the conversion cache for the next run.
+
+        Args:
+            cache_path: Path to the cache file
+            cache: Mapping of source path to its mtime and destination
+        """
+        try:
+            with cache_path.open('w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            print(f"Warning: Could not write cache file {cache_path}: {e}")
+
     @staticmethod
     def copy_media_files(source_folder: Path, dest_folder: Path, media_dir: str = 'media') -> None:
         """
@@ -115,22 +184,34 @@ class FileHandler:
             return
 
         try:
-            # Walk through all files in the media directory
-            for file_path in media_source.rglob('*'):
-                if file_path.is_file():
-                    # Calculate relative path to maintain directory structure
-                    rel_path = file_path.relative_to(media_source)
-                    dest_path = media_dest / rel_path
-                    
-                    # Create destination directory if it doesn't exist
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Copy file if it doesn't exist or has been modified
-                    if not dest_path.exists() or (
-                        file_path.stat().st_mtime > dest_path.stat().st_mtime
-                    ):
-                        shutil.copy2(file_path, dest_path)
-                        print(f"Copied media file: {rel_path}")
+            # Index the destination tree once instead of stat-ing every
+            # candidate file individually
+            existing = {}
+            if media_dest.exists():
+                for dest_path, dest_stat in FileHandler.iter_files(media_dest):
+                    existing[dest_path.relative_to(media_dest)] = dest_stat.st_mtime
+
+            # Collect files that are new or have been modified
+            to_copy = []
+            for file_path, source_stat in FileHandler.iter_files(media_source):
+                # Calculate relative path to maintain directory structure
+                rel_path = file_path.relative_to(media_source)
+                dest_mtime = existing.get(rel_path)
+                if dest_mtime is None or source_stat.st_mtime > dest_mtime:
+                    to_copy.append((file_path, media_dest / rel_path))
+
+            # Create each destination directory once, up front
+            for parent in {dest_path.parent for _, dest_path in to_copy}:
+                parent.mkdir(parents=True, exist_ok=True)
+
+            # Copying is I/O-bound, so overlap the copies with a thread pool
+            def copy_one(pair):
+                src_path, dest_path = pair
+                shutil.copy2(src_path, dest_path)
+                print(f"Copied media file: {dest_path.relative_to(media_dest)}")
+
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                list(executor.map(copy_one, to_copy))
 
         except Exception as e:
             print(f"Error copying media files: {str(e)}")
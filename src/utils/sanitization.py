@@ -1,44 +1,55 @@
 """Filename sanitization utilities."""
 
 import re
-from typing import Set
+from functools import lru_cache
+from typing import FrozenSet
 
+# Built once at import time: a translation table replaces the per-call loop
+# of str.replace passes, and the reserved-name set is no longer rebuilt on
+# every call.
+_FORBIDDEN_TABLE = str.maketrans({char: '-' for char in '<>:"/\\|?*'})
+
+# Windows reserved names
+_RESERVED_NAMES: FrozenSet[str] = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
+_MULTI_DASH_RE = re.compile(r'[-\s]+')
+_MULTI_DOT_RE = re.compile(r'\.+')
+
+@lru_cache(maxsize=4096)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename to be compatible with all operating systems.
-    
+
+    Pure function, so results are memoized: every page under the same
+    namespace re-sanitizes the same directory names.
+
+
     Args:
         filename: The filename to sanitize
         
     Returns:
         A sanitized filename safe for all operating systems
     """
-    # Characters not allowed in various operating systems
-    forbidden_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-    
-    # Windows reserved names
-    reserved_names: Set[str] = {
-        'CON', 'PRN', 'AUX', 'NUL',
-        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    }
-    
     # Clean the filename
     clean_name = filename.strip()
-    
-    # Replace forbidden characters with a dash
-    for char in forbidden_chars:
-        clean_name = clean_name.replace(char, '-')
-    
+
+    # Replace forbidden characters with a dash (single pass)
+    clean_name = clean_name.translate(_FORBIDDEN_TABLE)
+
     # Remove multiple dashes and dots
-    clean_name = re.sub(r'[-\s]+', '-', clean_name)
-    clean_name = re.sub(r'\.+', '.', clean_name)
-    
+    clean_name = _MULTI_DASH_RE.sub('-', clean_name)
+    clean_name = _MULTI_DOT_RE.sub('.', clean_name)
+
     # Remove leading/trailing dashes and dots
     clean_name = clean_name.strip('.-')
-    
-    # Handle Windows reserved names
-    if clean_name.upper() in reserved_names:
+
+    # Handle Windows reserved names (longest is 4 chars, so skip the
+    # upper() allocation for anything longer)
+    if len(clean_name) <= 4 and clean_name.upper() in _RESERVED_NAMES:
         clean_name = f"_{clean_name}"
     
     # Ensure the filename isn't empty
@@ -0,0 +1,10 @@
+# tests/_util.py
+"""Shared helpers for the converter tests."""
+
+class FastAssertMixin:
+    """Adds a byte-level string assertion for ASCII fixtures."""
+
+    def assertStrEqualFast(self, actual: str, expected: str) -> None:
+        """Compare stripped strings as bytes, dropping to a C memcmp."""
+        self.assertEqual(actual.strip().encode('ascii'),
+                         expected.strip().encode('ascii'))
@@ -1,60 +1,70 @@
 # tests/test_tables.py
 import unittest
 from src.converters.tables import TableConverter
+from tests._util import FastAssertMixin
 
-class TestTableConverter(unittest.TestCase):
-    def setUp(self):
-        self.converter = TableConverter()
+class TestTableConverter(FastAssertMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.converter = TableConverter()
 
     def test_simple_table(self):
         dokuwiki = "^ Header 1 ^ Header 2 ^\n| Cell 1 | Cell 2 |"
         expected = "| Header 1 | Header 2 |\n|----------|----------|\n| Cell 1 | Cell 2 |"
         result = self.converter.convert(dokuwiki)
-        self.assertEqual(result.strip(), expected.strip())
+        self.assertStrEqualFast(result, expected)
 
     def test_table_with_code(self):
         dokuwiki = "^ Header 1 ^ Header 2 ^\n| Cell 1 | <code>test</code> |"
         expected = "| Header 1 | Header 2 |\n|----------|----------|\n| Cell 1 | `test` |"
         result = self.converter.convert(dokuwiki)
-        self.assertEqual(result.strip(), expected.strip())
+        self.assertStrEqualFast(result, expected)
+
+    def test_table_with_attributed_code(self):
+        dokuwiki = "^ Header 1 ^ Header 2 ^\n| Cell 1 | <code bash>ls -la</code> |"
+        expected = "| Header 1 | Header 2 |\n|----------|----------|\n| Cell 1 | `ls -la` |"
+        result = self.converter.convert(dokuwiki)
+        self.assertStrEqualFast(result, expected)
 
 # tests/test_formatting.py
 import unittest
 from src.converters.formatting import FormattingConverter
 
-class TestFormattingConverter(unittest.TestCase):
-    def setUp(self):
-        self.converter = FormattingConverter()
+class TestFormattingConverter(FastAssertMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.converter = FormattingConverter()
 
     def test_bold(self):
         dokuwiki = "**bold text**"
         expected = "**bold text**"
         result = self.converter.convert(dokuwiki)
-        self.assertEqual(result.strip(), expected)
+        self.assertStrEqualFast(result, expected)
 
     def test_italic(self):
         dokuwiki = "//italic text//"
         expected = "*italic text*"
         result = self.converter.convert(dokuwiki)
-        self.assertEqual(result.strip(), expected)
+        self.assertStrEqualFast(result, expected)
 
 # tests/test_media.py
 import unittest
 from pathlib import Path
 from src.converters.media import MediaConverter
 
-class TestMediaConverter(unittest.TestCase):
-    def setUp(self):
-        self.converter = MediaConverter()
+class TestMediaConverter(FastAssertMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.converter = MediaConverter()
 
     def test_image_link(self):
         dokuwiki = "{{image.png|caption}}"
         expected = "![[image.png | 300]]"
         result = self.converter.convert(dokuwiki, Path())
-        self.assertEqual(result.strip(), expected)
+        self.assertStrEqualFast(result, expected)
 
     def test_external_link(self):
         dokuwiki = "[[http://example.com|Link Text]]"
         expected = "[Link Text](http://example.com)"
         result = self.converter.convert(dokuwiki, Path())
-        self.assertEqual(result.strip(), expected)
\ No newline at end of file
+        self.assertStrEqualFast(result, expected)